@@ -463,7 +463,7 @@ class AnsibleCloudStack:
 
     def get_os_type(self, key=None):
         if self.os_type:
-            return self._get_by_key(key, self.zone)
+            return self._get_by_key(key, self.os_type)
 
         os_type = self.module.params.get('os_type')
         if not os_type:
@@ -601,6 +601,9 @@ class AnsibleCloudStack:
 
     def poll_job(self, job=None, key=None):
         if 'jobid' in job:
+            # Start polling with a short interval, quick jobs should not wait
+            # a full cycle, and back off exponentially for long running ones.
+            poll_interval = 0.05
             while True:
                 res = self.query_api('queryAsyncJobResult', jobid=job['jobid'])
                 if res['jobstatus'] != 0 and 'jobresult' in res:
@@ -612,7 +615,8 @@ class AnsibleCloudStack:
                         job = res['jobresult'][key]
 
                     break
-                time.sleep(2)
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, 2)
         return job
 
     def get_result(self, resource):
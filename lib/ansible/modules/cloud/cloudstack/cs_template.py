@@ -347,6 +347,8 @@ project:
   sample: Production
 '''
 
+import re
+
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.cloudstack import (
     AnsibleCloudStack,
@@ -355,6 +357,8 @@ from ansible.module_utils.cloudstack import (
     CS_HYPERVISORS
 )
 
+UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
 
 class AnsibleCloudStackTemplate(AnsibleCloudStack):
 
@@ -367,7 +371,7 @@ class AnsibleCloudStackTemplate(AnsibleCloudStack):
             'templatetag': 'template_tag',
             'sshkeyenabled': 'sshkey_enabled',
             'passwordenabled': 'password_enabled',
-            'tempaltetype': 'template_type',
+            'templatetype': 'template_type',
             'ostypename': 'os_type',
             'crossZones': 'cross_zones',
             'isextractable': 'is_extractable',
@@ -422,12 +426,22 @@ class AnsibleCloudStackTemplate(AnsibleCloudStack):
             'account': self.get_account(key='name'),
             'domainid': self.get_domain(key='id'),
             'projectid': self.get_project(key='id'),
-            'volumeid': self.get_root_volume('id')
         }
+        # Look up a snapshot given by its id directly, without resolving the root volume
+        if UUID_RE.match(snapshot):
+            args['id'] = snapshot
+        else:
+            args['volumeid'] = self.get_root_volume('id')
+            args['name'] = snapshot
+
         snapshots = self.query_api('listSnapshots', **args)
+        if not snapshots and 'volumeid' in args:
+            # Fall back to search all snapshots of the volume
+            args['name'] = None
+            snapshots = self.query_api('listSnapshots', **args)
         if snapshots:
             for s in snapshots['snapshot']:
-                if snapshot in [s['name'], s['id']]:
+                if snapshot == s['name'] or snapshot == s['id']:
                     return self._get_by_key(key, s)
         self.module.fail_json(msg="Snapshot '%s' not found" % snapshot)
 